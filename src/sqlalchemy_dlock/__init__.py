@@ -7,3 +7,15 @@ from ._version import __version__, __version_tuple__
 from .exceptions import SqlAlchemyDLockBaseException, SqlAlchemyDLockDatabaseError
 from .factory import create_async_sadlock, create_sadlock
 from .lock import BaseAsyncSadLock, BaseSadLock
+
+__all__ = [
+    "version",
+    "__version__",
+    "__version_tuple__",
+    "SqlAlchemyDLockBaseException",
+    "SqlAlchemyDLockDatabaseError",
+    "create_sadlock",
+    "create_async_sadlock",
+    "BaseSadLock",
+    "BaseAsyncSadLock",
+]
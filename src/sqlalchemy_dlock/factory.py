@@ -1,7 +1,6 @@
 from typing import TypeVar, Union
 
 from sqlalchemy.engine import Connection
-from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_scoped_session
 from sqlalchemy.orm import Session, scoped_session
 
 from .lock.base import AsyncConnT, BaseAsyncSadLock, BaseSadLock, ConnT
@@ -61,6 +60,9 @@ def create_async_sadlock(
     connection_or_session: AsyncConnT, key: KTV, /, contextual_timeout: Union[float, int, None] = None, **kwargs
 ) -> BaseAsyncSadLock[KTV, AsyncConnT]:
     """AsyncIO version of :func:`create_sadlock`"""
+    # imported on demand, only the asyncio factory checks these types
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_scoped_session
+
     if isinstance(connection_or_session, AsyncConnection):
         engine_name = connection_or_session.engine.name
     elif isinstance(connection_or_session, (AsyncSession, async_scoped_session)):
@@ -1,19 +1,8 @@
-import sys
 from abc import ABC, abstractmethod
 from threading import local
 from typing import Callable, Generic, Optional, TypeVar, Union
 
-if sys.version_info >= (3, 11):  # pragma: no cover
-    from typing import Self
-else:  # pragma: no cover
-    from typing_extensions import Self
-
-if sys.version_info < (3, 12):  # pragma: no cover
-    from typing_extensions import override
-else:  # pragma: no cover
-    from typing import override
-
-from ..typing import AsyncConnectionOrSessionT, ConnectionOrSessionT
+from ..typing import AsyncConnectionOrSessionT, ConnectionOrSessionT, Self, override
 
 VKTV = TypeVar("VKTV")
 AKTV = TypeVar("AKTV")
@@ -63,6 +52,10 @@ class BaseSadLock(AbstractLockMixin, Generic[VKTV, ConnT], local, ABC):
         A :exc:`TimeoutError` will be thrown if acquire timeout in :keyword:`with` statement.
     """
 
+    # NOTE: Do not declare ``__slots__`` in lock classes.
+    # Slot descriptors are stored on the class and bypass the per-thread ``__dict__`` of :class:`threading.local`,
+    # so attributes kept in slots would be shared by every thread and the lock would no longer be thread-local.
+
     @override
     def __init__(
         self, connection_or_session: ConnT, key: VKTV, /, contextual_timeout: Union[float, int, None] = None, **kwargs
@@ -108,15 +101,11 @@ class BaseSadLock(AbstractLockMixin, Generic[VKTV, ConnT], local, ABC):
         return self
 
     def __exit__(self, exc_type, exc_value, exc_tb):
-        self.close()
+        if self._acquired:
+            self.close()
 
     def __str__(self) -> str:
-        return "<{} {} key={} at 0x{:x}>".format(
-            "locked" if self._acquired else "unlocked",
-            self.__class__.__name__,
-            self._key,
-            id(self),
-        )
+        return f"<{'locked' if self._acquired else 'unlocked'} {self.__class__.__name__} key={self._key} at 0x{id(self):x}>"
 
     @property
     def connection_or_session(self) -> ConnT:
@@ -216,6 +205,8 @@ class BaseSadLock(AbstractLockMixin, Generic[VKTV, ConnT], local, ABC):
 class BaseAsyncSadLock(AbstractLockMixin, Generic[VKTV, AsyncConnT], local, ABC):
     """Async version of :class:`.BaseSadLock`"""
 
+    # NOTE: No ``__slots__``, for the same reason as :class:`.BaseSadLock`.
+
     def __init__(
         self, connection_or_session: AsyncConnT, key: VKTV, /, contextual_timeout: Union[float, int, None] = None, **kwargs
     ):
@@ -233,15 +224,12 @@ class BaseAsyncSadLock(AbstractLockMixin, Generic[VKTV, AsyncConnT], local, ABC)
         return self
 
     async def __aexit__(self, exc_type, exc_value, exc_tb):
-        await self.close()
-
-    def __str__(self):
-        return "<{} {} key={} at 0x{:x}>".format(
-            "locked" if self._acquired else "unlocked",
-            self.__class__.__name__,
-            self._key,
-            id(self),
-        )
+        # skip creating the coroutine of close() when there is nothing to release
+        if self._acquired:
+            await self.close()
+
+    def __str__(self) -> str:
+        return f"<{'locked' if self._acquired else 'unlocked'} {self.__class__.__name__} key={self._key} at 0x{id(self):x}>"
 
     @property
     def connection_or_session(self) -> AsyncConnT:
@@ -1,14 +1,10 @@
-import sys
-from typing import Callable, Optional, TypeVar, Union
-
-if sys.version_info < (3, 12):  # pragma: no cover
-    from typing_extensions import override
-else:  # pragma: no cover
-    from typing import override
+from contextlib import suppress
+from hashlib import blake2b
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, TypeVar, Union
 
 from ..exceptions import SqlAlchemyDLockDatabaseError
-from ..statement.mysql import LOCK, UNLOCK
-from ..typing import AsyncConnectionOrSessionT, ConnectionOrSessionT
+from ..statement.mysql import LOCK, UNLOCK, make_lock_many
+from ..typing import AsyncConnectionOrSessionT, ConnectionOrSessionT, override
 from .base import AbstractLockMixin, BaseAsyncSadLock, BaseSadLock
 
 MYSQL_LOCK_NAME_MAX_LENGTH = 64
@@ -16,12 +12,63 @@ MYSQL_LOCK_NAME_MAX_LENGTH = 64
 KT = Union[bytes, bytearray, memoryview, str, int, float]
 KTV = TypeVar("KTV", bound=KT)
 
+# exact-type lookup table for :meth:`MysqlSadLockMixin.convert`, sub-classes fall back to ``isinstance`` checks
+_KEY_CONVERTERS: Dict[type, Callable[[Any], str]] = {
+    str: str,
+    int: str,
+    float: str,
+    bytes: bytes.decode,
+    bytearray: bytearray.decode,
+    memoryview: lambda k: k.tobytes().decode(),
+}
+
+
+def _get_lock_timeout(block: bool, timeout: Union[float, int, None]) -> Union[float, int]:
+    """Translate :meth:`.BaseSadLock.acquire`'s ``block`` and ``timeout`` arguments to ``GET_LOCK``'s timeout"""
+    if not block:
+        return 0
+    # None: set the timeout period to infinite.
+    if timeout is None:
+        return -1
+    # negative value for `timeout` are equivalent to a `timeout` of zero
+    return timeout if timeout > 0 else 0
+
+
+# locks acquired together by the ``acquire_many`` class methods
+_LocksT = Sequence[Union["MysqlSadLock", "MysqlAsyncSadLock"]]
+
+
+def _lock_many_params(locks: _LocksT, timeout: Union[float, int]) -> Dict[str, Any]:
+    """Bind parameters of ``make_lock_many(len(locks))``"""
+    params: Dict[str, Any] = {f"str_{i}": lock.actual_key for i, lock in enumerate(locks)}
+    params["timeout"] = timeout
+    return params
+
+
+def _set_lock_many_result(locks: _LocksT, row, timeout: Union[float, int]) -> None:
+    """Set the state of each lock by the columns of ``make_lock_many``'s result row
+
+    Every column is checked before any error is raised, so locks acquired by the other columns are all marked ``locked``.
+    """
+    errors = []
+    for lock, ret_val in zip(locks, row):
+        if ret_val == 1:
+            lock._acquired = True
+        elif ret_val == 0:
+            pass  # 直到超时也没有成功锁定
+        elif ret_val is None:  # pragma: no cover
+            errors.append(f"An error occurred while attempting to obtain the lock {lock.actual_key!r}")
+        else:  # pragma: no cover
+            errors.append(f"GET_LOCK({lock.actual_key!r}, {timeout}) returns {ret_val}")
+    if errors:  # pragma: no cover
+        raise SqlAlchemyDLockDatabaseError("; ".join(errors))
+
 
 class MysqlSadLockMixin(AbstractLockMixin[KTV, str]):
     """A Mix-in class for MySQL named lock"""
 
     @override
-    def __init__(self, *, key: KTV, convert: Optional[Callable[[KTV], str]] = None, **kwargs):
+    def __init__(self, *, key: KTV, convert: Optional[Callable[[KTV], str]] = None, hash_oversize: bool = False, **kwargs):
         """
         Args:
             key: MySQL named lock requires the key given by string.
@@ -46,15 +93,30 @@ class MysqlSadLockMixin(AbstractLockMixin[KTV, str]):
                         def convert(value) -> str:
                             # get a string key by `value`
                             return the_string_covert_from_value
+
+            hash_oversize: What to do when the converted ``key`` is longer than :data:`MYSQL_LOCK_NAME_MAX_LENGTH`.
+
+                - :data:`False` (default): :class:`ValueError` is raised.
+                - :data:`True`: the key is replaced by the 64 characters hex digest of its :func:`hashlib.blake2b` checksum.
+
+                Caution:
+                    Different oversize keys may collide after hashing (unlikely with a 256 bits digest),
+                    and a hashed key is not readable in MySQL's ``performance_schema.metadata_locks``.
         """
         if convert:
-            self._actual_key = convert(key)
+            actual_key = convert(key)
         else:
-            self._actual_key = self.convert(key)
-        if not isinstance(self._actual_key, str):
+            actual_key = self.convert(key)
+        if not isinstance(actual_key, str):
             raise TypeError("MySQL named lock requires the key given by string")
-        if len(self._actual_key) > MYSQL_LOCK_NAME_MAX_LENGTH:
-            raise ValueError(f"MySQL enforces a maximum length on lock names of {MYSQL_LOCK_NAME_MAX_LENGTH} characters.")
+        if len(actual_key) > MYSQL_LOCK_NAME_MAX_LENGTH:
+            if not hash_oversize:
+                raise ValueError(f"MySQL enforces a maximum length on lock names of {MYSQL_LOCK_NAME_MAX_LENGTH} characters.")
+            # a 32 bytes digest is exactly 64 hex characters
+            actual_key = blake2b(actual_key.encode(), digest_size=MYSQL_LOCK_NAME_MAX_LENGTH // 2).hexdigest()
+        self._actual_key = actual_key
+        # bind parameters of ``RELEASE_LOCK``, built once and passed to every ``execute``
+        self._params = {"str": actual_key}
 
     @override
     def get_actual_key(self) -> str:
@@ -63,6 +125,9 @@ class MysqlSadLockMixin(AbstractLockMixin[KTV, str]):
 
     @classmethod
     def convert(cls, k) -> str:
+        fn = _KEY_CONVERTERS.get(type(k))
+        if fn is not None:
+            return fn(k)
         if isinstance(k, str):
             return k
         if isinstance(k, (int, float)):
@@ -102,17 +167,8 @@ class MysqlSadLock(MysqlSadLockMixin, BaseSadLock[str, ConnectionOrSessionT]):
     def acquire(self, block: bool = True, timeout: Union[float, int, None] = None, *args, **kwargs) -> bool:
         if self._acquired:
             raise ValueError("invoked on a locked lock")
-        if block:
-            # None: set the timeout period to infinite.
-            if timeout is None:
-                timeout = -1
-            # negative value for `timeout` are equivalent to a `timeout` of zero
-            elif timeout < 0:
-                timeout = 0
-        else:
-            timeout = 0
-        stmt = LOCK.params(str=self.key, timeout=timeout)
-        ret_val = self.connection_or_session.execute(stmt).scalar_one()
+        timeout = _get_lock_timeout(block, timeout)
+        ret_val = self.connection_or_session.execute(LOCK, {"str": self._actual_key, "timeout": timeout}).scalar_one()
         if ret_val == 1:
             self._acquired = True
         elif ret_val == 0:
@@ -123,12 +179,68 @@ class MysqlSadLock(MysqlSadLockMixin, BaseSadLock[str, ConnectionOrSessionT]):
             raise SqlAlchemyDLockDatabaseError(f"GET_LOCK({self.key!r}, {timeout}) returns {ret_val}")
         return self._acquired
 
+    @classmethod
+    def acquire_many(
+        cls,
+        connection_or_session: ConnectionOrSessionT,
+        keys: Iterable[KT],
+        block: bool = True,
+        timeout: Union[float, int, None] = None,
+        **kwargs,
+    ) -> List["MysqlSadLock"]:
+        """Create a lock for each of ``keys`` and acquire them all in one round-trip
+
+        The ``GET_LOCK`` calls are sent in one ``SELECT`` statement, instead of one statement per lock.
+
+        Args:
+            connection_or_session: :attr:`.BaseSadLock.connection_or_session`
+            keys: Keys of the locks, each one is converted as the ``key`` argument of the constructor
+            block: see :meth:`.BaseSadLock.acquire`
+            timeout: see :meth:`.BaseSadLock.acquire`
+            **kwargs: other named parameters pass to the constructor
+
+        Returns:
+            New created lock objects, in the same order as ``keys``.
+
+            Not all of them are necessarily acquired, check :attr:`.BaseSadLock.locked` of each one.
+
+        Raises:
+            SqlAlchemyDLockDatabaseError: Some ``GET_LOCK`` returned an error.
+                The locks acquired by the other ``GET_LOCK`` calls of the statement are released before raising.
+
+        Attention:
+            Acquiring more than one lock in a statement requires MySQL 5.7.5 or later.
+            MySQL evaluates the ``GET_LOCK`` calls one after another, each waits at most ``timeout`` seconds,
+            so the whole statement may take up to ``len(keys) * timeout`` seconds.
+            The keys are locked in the given order, pass them in a consistent order to avoid deadlocks.
+
+        Caution:
+            If the statement itself fails part way (eg: ``ER_USER_LOCK_DEADLOCK``, or a lost connection),
+            the locks already obtained by it stay held by the MySQL session, and there is no lock object to release them.
+            Do not return such a connection to the pool, invalidate or close it instead.
+        """
+        locks = [cls(connection_or_session, key, **kwargs) for key in keys]
+        if not locks:
+            return locks
+        timeout = _get_lock_timeout(block, timeout)
+        params = _lock_many_params(locks, timeout)
+        row = connection_or_session.execute(make_lock_many(len(locks)), params).one()
+        try:
+            _set_lock_many_result(locks, row, timeout)
+        except SqlAlchemyDLockDatabaseError:  # pragma: no cover
+            # the locks never reach the caller, do not leave any of them held.
+            # a failed release must neither hide the original error nor stop releasing the others.
+            for lock in locks:
+                with suppress(Exception):
+                    lock.close()
+            raise
+        return locks
+
     @override
     def release(self):
         if not self._acquired:
             raise ValueError("invoked on an unlocked lock")
-        stmt = UNLOCK.params(str=self.key)
-        ret_val = self.connection_or_session.execute(stmt).scalar_one()
+        ret_val = self.connection_or_session.execute(UNLOCK, self._params).scalar_one()
         if ret_val == 1:
             self._acquired = False
         elif ret_val == 0:
@@ -159,17 +271,8 @@ class MysqlAsyncSadLock(MysqlSadLockMixin, BaseAsyncSadLock[str, AsyncConnection
     async def acquire(self, block: bool = True, timeout: Union[float, int, None] = None, *args, **kwargs) -> bool:
         if self._acquired:
             raise ValueError("invoked on a locked lock")
-        if block:
-            # None: set the timeout period to infinite.
-            if timeout is None:
-                timeout = -1
-            # negative value for `timeout` are equivalent to a `timeout` of zero
-            elif timeout < 0:
-                timeout = 0
-        else:
-            timeout = 0
-        stmt = LOCK.params(str=self.key, timeout=timeout)
-        ret_val = (await self.connection_or_session.execute(stmt)).scalar_one()
+        timeout = _get_lock_timeout(block, timeout)
+        ret_val = (await self.connection_or_session.execute(LOCK, {"str": self._actual_key, "timeout": timeout})).scalar_one()
         if ret_val == 1:
             self._acquired = True
         elif ret_val == 0:
@@ -180,12 +283,38 @@ class MysqlAsyncSadLock(MysqlSadLockMixin, BaseAsyncSadLock[str, AsyncConnection
             raise SqlAlchemyDLockDatabaseError(f"GET_LOCK({self.key!r}, {timeout}) returns {ret_val}")
         return self._acquired
 
+    @classmethod
+    async def acquire_many(
+        cls,
+        connection_or_session: AsyncConnectionOrSessionT,
+        keys: Iterable[KT],
+        block: bool = True,
+        timeout: Union[float, int, None] = None,
+        **kwargs,
+    ) -> List["MysqlAsyncSadLock"]:
+        """Async IO version of :meth:`MysqlSadLock.acquire_many`"""
+        locks = [cls(connection_or_session, key, **kwargs) for key in keys]
+        if not locks:
+            return locks
+        timeout = _get_lock_timeout(block, timeout)
+        params = _lock_many_params(locks, timeout)
+        row = (await connection_or_session.execute(make_lock_many(len(locks)), params)).one()
+        try:
+            _set_lock_many_result(locks, row, timeout)
+        except SqlAlchemyDLockDatabaseError:  # pragma: no cover
+            # the locks never reach the caller, do not leave any of them held.
+            # a failed release must neither hide the original error nor stop releasing the others.
+            for lock in locks:
+                with suppress(Exception):
+                    await lock.close()
+            raise
+        return locks
+
     @override
     async def release(self):
         if not self._acquired:
             raise ValueError("invoked on an unlocked lock")
-        stmt = UNLOCK.params(str=self.key)
-        ret_val = (await self.connection_or_session.execute(stmt)).scalar_one()
+        ret_val = (await self.connection_or_session.execute(UNLOCK, self._params)).scalar_one()
         if ret_val == 1:
             self._acquired = False
         elif ret_val == 0:
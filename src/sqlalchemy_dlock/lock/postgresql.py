@@ -1,36 +1,58 @@
 import asyncio
 import sys
+from functools import lru_cache
 from hashlib import blake2b
-from time import sleep, time
-from typing import Callable, Optional, TypeVar, Union
+from struct import Struct
+from time import monotonic, sleep
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, TypeVar, Union
 from warnings import catch_warnings, warn
 
-if sys.version_info < (3, 12):  # pragma: no cover
-    from typing_extensions import override
-else:  # pragma: no cover
-    from typing import override
-
 from ..exceptions import SqlAlchemyDLockDatabaseError
 from ..statement.postgresql import (
-    LOCK,
-    LOCK_SHARED,
-    LOCK_XACT,
-    LOCK_XACT_SHARED,
+    MANY_STATEMENTS,
+    SLEEP_INTERVAL_BACKOFF,
     SLEEP_INTERVAL_DEFAULT,
     SLEEP_INTERVAL_MIN,
-    TRY_LOCK,
-    TRY_LOCK_SHARED,
-    TRY_LOCK_XACT,
-    TRY_LOCK_XACT_SHARED,
-    UNLOCK,
-    UNLOCK_SHARED,
+    STATEMENTS,
 )
-from ..typing import AsyncConnectionOrSessionT, ConnectionOrSessionT
+from ..typing import AsyncConnectionOrSessionT, ConnectionOrSessionT, override
 from .base import AbstractLockMixin, BaseAsyncSadLock, BaseSadLock
 
 KT = Union[bytes, bytearray, memoryview, str, int, float]
 KTV = TypeVar("KTV", bound=KT)
 
+# signed int64 in native byte order, same as ``int.from_bytes(b, sys.byteorder, signed=True)``
+_INT64 = Struct("=q")
+
+
+def _blake2b_int64(d) -> int:
+    return _INT64.unpack(blake2b(d, digest_size=8).digest())[0]
+
+
+@lru_cache(maxsize=1024)
+def blake2b_int64(k: Union[str, bytes]) -> int:
+    """Signed int64 key calculated by :func:`hashlib.blake2b` from a :class:`str` or :class:`bytes` key
+
+    Results of the recently used keys are kept in a LRU cache of 1024 entries,
+    call ``blake2b_int64.cache_clear()`` to empty it.
+    """
+    return _blake2b_int64(k.encode() if isinstance(k, str) else k)
+
+
+_XACT_RELEASE_WARNING = (
+    "PostgreSQL transaction level advisory locks are held until the current transaction ends; "
+    "there is no provision for manual release."
+)
+
+# exact-type lookup table for :meth:`PostgresqlSadLockMixin.convert`, sub-classes fall back to ``isinstance`` checks
+_KEY_CONVERTERS: Dict[type, Callable[[Any], int]] = {
+    int: int,
+    str: blake2b_int64,
+    bytes: blake2b_int64,
+    bytearray: _blake2b_int64,
+    memoryview: lambda k: _blake2b_int64(k.tobytes()),
+}
+
 
 class PostgresqlSadLockMixin(AbstractLockMixin[KTV, int]):
     """A Mix-in class for PostgreSQL advisory lock"""
@@ -47,6 +69,7 @@ class PostgresqlSadLockMixin(AbstractLockMixin[KTV, int]):
                   :class:`OverflowError` is raised if too big or too small for that.
 
                 * When ``key`` is :class:`str` or :class:`bytes` or alike, the constructor calculates its checksum by :func:`hashlib.blake2b`, and takes the hash result integer value as actual key.
+                  Checksums of :class:`str` and :class:`bytes` keys are cached, see :func:`blake2b_int64`.
 
                 * Or you can specify a ``convert`` function to that argument::
 
@@ -63,25 +86,13 @@ class PostgresqlSadLockMixin(AbstractLockMixin[KTV, int]):
         else:
             self._actual_key = self.convert(key)
         self._actual_key = self.ensure_int64(self._actual_key)
+        # bind parameters of the lock statements, built once and passed to every ``execute``
+        self._params = {"key": self._actual_key}
         #
         self._shared = bool(shared)
         self._xact = bool(xact)
         #
-        self._stmt_unlock = None
-        if not shared and not xact:
-            self._stmt_lock = LOCK.params(key=self._actual_key)
-            self._stmt_try_lock = TRY_LOCK.params(key=self._actual_key)
-            self._stmt_unlock = UNLOCK.params(key=self._actual_key)
-        elif shared and not xact:
-            self._stmt_lock = LOCK_SHARED.params(key=self._actual_key)
-            self._stmt_try_lock = TRY_LOCK_SHARED.params(key=self._actual_key)
-            self._stmt_unlock = UNLOCK_SHARED.params(key=self._actual_key)
-        elif not shared and xact:
-            self._stmt_lock = LOCK_XACT.params(key=self._actual_key)
-            self._stmt_try_lock = TRY_LOCK_XACT.params(key=self._actual_key)
-        else:
-            self._stmt_lock = LOCK_XACT_SHARED.params(key=self._actual_key)
-            self._stmt_try_lock = TRY_LOCK_XACT_SHARED.params(key=self._actual_key)
+        self._stmt_lock, self._stmt_try_lock, self._stmt_unlock = STATEMENTS[(self._shared, self._xact)]
 
     @override
     def get_actual_key(self) -> int:
@@ -91,6 +102,9 @@ class PostgresqlSadLockMixin(AbstractLockMixin[KTV, int]):
     @classmethod
     def convert(cls, k) -> int:
         """To int64"""
+        fn = _KEY_CONVERTERS.get(type(k))
+        if fn is not None:
+            return fn(k)
         if isinstance(k, int):
             return k
         if isinstance(k, str):
@@ -101,7 +115,7 @@ class PostgresqlSadLockMixin(AbstractLockMixin[KTV, int]):
             d = k.tobytes()
         else:
             raise TypeError(type(k).__name__)
-        return int.from_bytes(blake2b(d, digest_size=8).digest(), sys.byteorder, signed=True)
+        return _blake2b_int64(d)
 
     @classmethod
     def ensure_int64(cls, i: int) -> int:
@@ -140,6 +154,53 @@ class PostgresqlSadLockMixin(AbstractLockMixin[KTV, int]):
         return self._actual_key
 
 
+# locks handled together by the ``*_many`` class methods
+_LocksT = Sequence[Union["PostgresqlSadLock", "PostgresqlAsyncSadLock"]]
+
+
+def _many_params(locks: _LocksT) -> Dict[str, Any]:
+    """Bind parameters of :data:`MANY_STATEMENTS` for ``locks``"""
+    return {"keys": [lock.actual_key for lock in locks]}
+
+
+def _set_lock_many_result(locks: _LocksT, rows=None) -> None:
+    """Set the state of each lock by the rows of a ``try_lock_many`` statement, or all acquired when no ``rows``"""
+    if rows is None:
+        for lock in locks:
+            lock._acquired = True
+    else:
+        for lock, (ret_val,) in zip(locks, rows):
+            lock._acquired = ret_val is True
+
+
+def _unlock_many_statement(locks: _LocksT):
+    """Check the locks to be released together, and return the statement releasing them"""
+    first = locks[0]
+    for lock in locks:
+        if not lock.locked:
+            raise ValueError("invoked on an unlocked lock")
+        if (
+            lock.connection_or_session is not first.connection_or_session
+            or lock.shared != first.shared
+            or lock.xact != first.xact
+        ):
+            raise ValueError("locks released together must have the same connection_or_session, shared and xact")
+    stmt = MANY_STATEMENTS[(first.shared, first.xact)][2]
+    if stmt is None:
+        warn(_XACT_RELEASE_WARNING, RuntimeWarning)
+    return stmt
+
+
+def _set_unlock_many_result(locks: _LocksT, rows):
+    not_held = []
+    for lock, (ret_val,) in zip(locks, rows):
+        lock._acquired = False
+        if not ret_val:  # pragma: no cover
+            not_held.append(lock.key)
+    if not_held:  # pragma: no cover
+        raise SqlAlchemyDLockDatabaseError(f"The advisory locks {not_held!r} were not held.")
+
+
 class PostgresqlSadLock(PostgresqlSadLockMixin, BaseSadLock[KT, ConnectionOrSessionT]):
     """A distributed lock implemented by PostgreSQL advisory lock
 
@@ -181,57 +242,137 @@ class PostgresqlSadLock(PostgresqlSadLockMixin, BaseSadLock[KT, ConnectionOrSess
 
         Attention:
             PostgreSQL's advisory lock has no timeout mechanism in itself.
-            When ``timeout`` is a non-negative number, we simulate it by **looping** and **sleeping**.
+            When ``timeout`` is a positive number, we simulate it by **looping** and **sleeping**;
+            when it is zero or negative, the lock is tried only once, the same as ``block=False``.
 
-            The ``interval`` argument specifies the sleep seconds(``1`` by default).
+            The sleep starts from ``0.1`` second, and grows by ``1.5`` times after every failed try,
+            until it reaches the ``interval`` argument (``1`` second by default).
+            A sleep never goes past the deadline, so a big ``interval`` does not make the call outlast ``timeout``.
 
             That is:
-                The actual timeout won't be precise when ``interval`` is big;
+                A big ``interval`` means fewer tries, so a lock released during a long sleep is noticed late;
                 while small ``interval`` will cause high CPU usage and frequent SQL execution.
         """
         if self._acquired:
             raise ValueError("invoked on a locked lock")
-        if block:
-            if timeout is None:
-                # None: set the timeout period to infinite.
-                self.connection_or_session.execute(self._stmt_lock).all()
+        if not block:
+            return self._acquire_try()
+        if timeout is None:
+            return self._acquire_blocking()
+        interval = SLEEP_INTERVAL_DEFAULT if interval is None else interval
+        if interval < SLEEP_INTERVAL_MIN:  # pragma: no cover
+            raise ValueError("interval too small")
+        if timeout <= 0:
+            # zero or negative `timeout`: try only once, the same as a non-blocking call.
+            return self._acquire_try()
+        return self._acquire_poll(timeout, interval)
+
+    def _acquire_blocking(self) -> bool:
+        # None: set the timeout period to infinite.
+        self.connection_or_session.execute(self._stmt_lock, self._params).close()
+        self._acquired = True
+        return True
+
+    def _acquire_try(self) -> bool:
+        # This will either obtain the lock immediately and return true,
+        # or return false without waiting if the lock cannot be acquired immediately.
+        # keep the attribute a bool, even if the driver returns something unexpected
+        self._acquired = self.connection_or_session.execute(self._stmt_try_lock, self._params).scalar() is True
+        return self._acquired
+
+    def _acquire_poll(self, timeout: Union[float, int], interval: Union[float, int]) -> bool:
+        # look-ups hoisted out of the polling loop
+        execute, stmt, params = self.connection_or_session.execute, self._stmt_try_lock, self._params
+        # back off exponentially from the minimal sleep, up to `interval`
+        delay = SLEEP_INTERVAL_MIN
+        # absolute deadline computed once, so each round takes a single clock reading
+        deadline = monotonic() + timeout
+        while True:
+            ret_val = execute(stmt, params).scalar()
+            if ret_val:  # succeed
                 self._acquired = True
-            else:
-                # negative value for `timeout` are equivalent to a `timeout` of zero.
-                if timeout < 0:
-                    timeout = 0
-                interval = SLEEP_INTERVAL_DEFAULT if interval is None else interval
-                if interval < SLEEP_INTERVAL_MIN:  # pragma: no cover
-                    raise ValueError("interval too small")
-                ts_begin = time()
-                while True:
-                    ret_val = self.connection_or_session.execute(self._stmt_try_lock).scalar_one()
-                    if ret_val:  # succeed
-                        self._acquired = True
-                        break
-                    if time() - ts_begin > timeout:  # expired
-                        break
-                    sleep(interval)
-        else:
-            # This will either obtain the lock immediately and return true,
-            # or return false without waiting if the lock cannot be acquired immediately.
-            ret_val = self.connection_or_session.execute(self._stmt_try_lock).scalar_one()
-            self._acquired = bool(ret_val)
-        #
+                break
+            remaining = deadline - monotonic()
+            if remaining < 0:  # expired
+                break
+            # never sleep past the deadline
+            sleep(min(delay, remaining))
+            delay = min(delay * SLEEP_INTERVAL_BACKOFF, interval)
         return self._acquired
 
+    @classmethod
+    def acquire_many(
+        cls,
+        connection_or_session: ConnectionOrSessionT,
+        keys: Iterable[KT],
+        block: bool = True,
+        **kwargs,
+    ) -> List["PostgresqlSadLock"]:
+        """Create a lock for each of ``keys`` and acquire them all in one round-trip
+
+        The advisory lock functions are called on an ``unnest`` of the keys array in one ``SELECT`` statement,
+        instead of one statement per lock.
+
+        Args:
+            connection_or_session: :attr:`.BaseSadLock.connection_or_session`
+            keys: Keys of the locks, each one is converted as the ``key`` argument of the constructor
+            block: Wait until all the locks are acquired if :data:`True`, else try each of them once.
+            **kwargs: other named parameters pass to the constructor, eg: ``shared``, ``xact``
+
+        Returns:
+            New created lock objects, in the same order as ``keys``.
+
+            When ``block`` is :data:`False`, not all of them are necessarily acquired,
+            check :attr:`.BaseSadLock.locked` of each one.
+
+        Attention:
+            PostgreSQL's advisory lock has no timeout mechanism in itself, so there is no ``timeout`` argument here.
+            The keys are locked in the given order, pass them in a consistent order to avoid deadlocks.
+
+        Caution:
+            If the statement fails part way (eg: ``deadlock_detected``, a cancel, or a lost connection),
+            the session level advisory locks already obtained by it stay held, a rollback does not release them,
+            and there is no lock object to release them with.
+            Which keys were locked can not be told, so do not return such a connection to the pool,
+            invalidate or close it instead.
+        """
+        locks = [cls(connection_or_session, key, **kwargs) for key in keys]
+        if not locks:
+            return locks
+        lock_many, try_lock_many, _ = MANY_STATEMENTS[(locks[0].shared, locks[0].xact)]
+        params = _many_params(locks)
+        if block:
+            connection_or_session.execute(lock_many, params).close()
+            _set_lock_many_result(locks)
+        else:
+            _set_lock_many_result(locks, connection_or_session.execute(try_lock_many, params).all())
+        return locks
+
+    @classmethod
+    def release_many(cls, locks: Sequence["PostgresqlSadLock"]):
+        """Release ``locks`` in one round-trip, the counterpart of :meth:`acquire_many`
+
+        Args:
+            locks: Acquired locks, all of them on the same ``connection_or_session``, with the same ``shared`` and ``xact``.
+
+        Attention:
+            Transaction level advisory locks can not be released manually,
+            a :class:`RuntimeWarning` is emitted and they remain acquired.
+        """
+        if not locks:
+            return
+        stmt = _unlock_many_statement(locks)
+        if stmt is not None:
+            _set_unlock_many_result(locks, locks[0].connection_or_session.execute(stmt, _many_params(locks)).all())
+
     @override
     def release(self):
         if not self._acquired:
             raise ValueError("invoked on an unlocked lock")
         if self._stmt_unlock is None:
-            warn(
-                "PostgreSQL transaction level advisory locks are held until the current transaction ends; "
-                "there is no provision for manual release.",
-                RuntimeWarning,
-            )
+            warn(_XACT_RELEASE_WARNING, RuntimeWarning)
             return
-        ret_val = self.connection_or_session.execute(self._stmt_unlock).scalar_one()
+        ret_val = self.connection_or_session.execute(self._stmt_unlock, self._params).scalar()
         if ret_val:
             self._acquired = False
         else:  # pragma: no cover
@@ -268,47 +409,90 @@ class PostgresqlAsyncSadLock(PostgresqlSadLockMixin, BaseAsyncSadLock[int, Async
     ) -> bool:
         if self._acquired:
             raise ValueError("invoked on a locked lock")
-        if block:
-            if timeout is None:
-                # None: set the timeout period to infinite.
-                _ = (await self.connection_or_session.execute(self._stmt_lock)).all()
+        if not block:
+            return await self._acquire_try()
+        if timeout is None:
+            return await self._acquire_blocking()
+        interval = SLEEP_INTERVAL_DEFAULT if interval is None else interval
+        if interval < SLEEP_INTERVAL_MIN:  # pragma: no cover
+            raise ValueError("interval too small")
+        if timeout <= 0:
+            # zero or negative `timeout`: try only once, the same as a non-blocking call.
+            return await self._acquire_try()
+        return await self._acquire_poll(timeout, interval)
+
+    async def _acquire_blocking(self) -> bool:
+        # None: set the timeout period to infinite.
+        (await self.connection_or_session.execute(self._stmt_lock, self._params)).close()
+        self._acquired = True
+        return True
+
+    async def _acquire_try(self) -> bool:
+        # This will either obtain the lock immediately and return true,
+        # or return false without waiting if the lock cannot be acquired immediately.
+        # keep the attribute a bool, even if the driver returns something unexpected
+        self._acquired = (await self.connection_or_session.execute(self._stmt_try_lock, self._params)).scalar() is True
+        return self._acquired
+
+    async def _acquire_poll(self, timeout: Union[float, int], interval: Union[float, int]) -> bool:
+        # look-ups hoisted out of the polling loop
+        execute, stmt, params = self.connection_or_session.execute, self._stmt_try_lock, self._params
+        async_sleep = asyncio.sleep
+        # back off exponentially from the minimal sleep, up to `interval`
+        delay = SLEEP_INTERVAL_MIN
+        # absolute deadline computed once, so each round takes a single clock reading
+        deadline = monotonic() + timeout
+        while True:
+            ret_val = (await execute(stmt, params)).scalar()
+            if ret_val:  # succeed
                 self._acquired = True
-            else:
-                # negative value for `timeout` are equivalent to a `timeout` of zero.
-                if timeout < 0:
-                    timeout = 0
-                interval = SLEEP_INTERVAL_DEFAULT if interval is None else interval
-                if interval < SLEEP_INTERVAL_MIN:  # pragma: no cover
-                    raise ValueError("interval too small")
-                ts_begin = time()
-                while True:
-                    ret_val = (await self.connection_or_session.execute(self._stmt_try_lock)).scalar_one()
-                    if ret_val:  # succeed
-                        self._acquired = True
-                        break
-                    if time() - ts_begin > timeout:  # expired
-                        break
-                    await asyncio.sleep(interval)
-        else:
-            # This will either obtain the lock immediately and return true,
-            # or return false without waiting if the lock cannot be acquired immediately.
-            ret_val = (await self.connection_or_session.execute(self._stmt_try_lock)).scalar_one()
-            self._acquired = bool(ret_val)
-        #
+                break
+            remaining = deadline - monotonic()
+            if remaining < 0:  # expired
+                break
+            # never sleep past the deadline
+            await async_sleep(min(delay, remaining))
+            delay = min(delay * SLEEP_INTERVAL_BACKOFF, interval)
         return self._acquired
 
+    @classmethod
+    async def acquire_many(
+        cls,
+        connection_or_session: AsyncConnectionOrSessionT,
+        keys: Iterable[KT],
+        block: bool = True,
+        **kwargs,
+    ) -> List["PostgresqlAsyncSadLock"]:
+        """Async IO version of :meth:`PostgresqlSadLock.acquire_many`"""
+        locks = [cls(connection_or_session, key, **kwargs) for key in keys]
+        if not locks:
+            return locks
+        lock_many, try_lock_many, _ = MANY_STATEMENTS[(locks[0].shared, locks[0].xact)]
+        params = _many_params(locks)
+        if block:
+            (await connection_or_session.execute(lock_many, params)).close()
+            _set_lock_many_result(locks)
+        else:
+            _set_lock_many_result(locks, (await connection_or_session.execute(try_lock_many, params)).all())
+        return locks
+
+    @classmethod
+    async def release_many(cls, locks: Sequence["PostgresqlAsyncSadLock"]):
+        """Async IO version of :meth:`PostgresqlSadLock.release_many`"""
+        if not locks:
+            return
+        stmt = _unlock_many_statement(locks)
+        if stmt is not None:
+            _set_unlock_many_result(locks, (await locks[0].connection_or_session.execute(stmt, _many_params(locks))).all())
+
     @override
     async def release(self):
         if not self._acquired:
             raise ValueError("invoked on an unlocked lock")
         if self._stmt_unlock is None:
-            warn(
-                "PostgreSQL transaction level advisory locks are held until the current transaction ends; "
-                "there is no provision for manual release.",
-                RuntimeWarning,
-            )
+            warn(_XACT_RELEASE_WARNING, RuntimeWarning)
             return
-        ret_val = (await self.connection_or_session.execute(self._stmt_unlock)).scalar_one()
+        ret_val = (await self.connection_or_session.execute(self._stmt_unlock, self._params)).scalar()
         if ret_val:
             self._acquired = False
         else:  # pragma: no cover
@@ -1,6 +1,7 @@
 import sys
 from importlib import import_module
 from string import Template
+from typing import Optional
 
 if sys.version_info >= (3, 9):
     from functools import cache
@@ -45,3 +46,22 @@ def find_lock_class(engine_name, is_asyncio=False):
     module = import_module(conf["module"], package)
     class_ = getattr(module, conf["class"])
     return class_
+
+
+def preload_lock_classes(is_asyncio: Optional[bool] = None) -> None:
+    """Import and cache the lock classes of all registered engines ahead of time
+
+    :func:`find_lock_class` imports an engine's lock module when the first lock of that engine is created.
+    Call this function at program startup to move that cost out of the first :func:`.create_sadlock` call.
+
+    Args:
+        is_asyncio: Preload only the asyncio lock classes if :data:`True`, only the sync ones if :data:`False`,
+            or both if :data:`None` (the default).
+    """
+    # called with the same arguments as the factory functions, the cache is keyed by the exact arguments.
+    if not is_asyncio:
+        for engine_name in REGISTRY:
+            find_lock_class(engine_name)
+    if is_asyncio or is_asyncio is None:
+        for engine_name in ASYNCIO_REGISTRY:
+            find_lock_class(engine_name, True)
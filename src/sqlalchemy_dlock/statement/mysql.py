@@ -1,4 +1,16 @@
-from sqlalchemy import text
+from functools import lru_cache
 
-LOCK = text("SELECT GET_LOCK(:str, :timeout)")
-UNLOCK = text("SELECT RELEASE_LOCK(:str)")
+from sqlalchemy import String, bindparam, text
+from sqlalchemy.sql.expression import TextClause
+
+LOCK = text("SELECT GET_LOCK(:str, :timeout)").bindparams(bindparam("str", type_=String))
+UNLOCK = text("SELECT RELEASE_LOCK(:str)").bindparams(bindparam("str", type_=String))
+
+
+# a small bound, statements of rarely used batch sizes are evicted instead of kept forever
+@lru_cache(maxsize=32)
+def make_lock_many(n: int) -> TextClause:
+    """``SELECT GET_LOCK(:str_0, :timeout), GET_LOCK(:str_1, :timeout), ...`` for ``n`` lock names"""
+    return text("SELECT " + ", ".join(f"GET_LOCK(:str_{i}, :timeout)" for i in range(n))).bindparams(
+        *(bindparam(f"str_{i}", type_=String) for i in range(n))
+    )
@@ -1,18 +1,57 @@
-from sqlalchemy import text
+from sqlalchemy import BigInteger, bindparam, text
+from sqlalchemy.sql.expression import TextClause
+from sqlalchemy.types import ARRAY
 
-LOCK = text("SELECT pg_advisory_lock(:key)")
-LOCK_SHARED = text("SELECT pg_advisory_lock_shared(:key)")
-LOCK_XACT = text("SELECT pg_advisory_xact_lock(:key)")
-LOCK_XACT_SHARED = text("SELECT pg_advisory_xact_lock_shared(:key)")
+# PostgreSQL advisory lock functions take a signed INT64 key
+_KEY = bindparam("key", type_=BigInteger)
 
-TRY_LOCK = text("SELECT pg_try_advisory_lock(:key)")
-TRY_LOCK_SHARED = text("SELECT pg_try_advisory_lock_shared(:key)")
-TRY_LOCK_XACT = text("SELECT pg_try_advisory_xact_lock(:key)")
-TRY_LOCK_XACT_SHARED = text("SELECT pg_try_advisory_xact_lock_shared(:key)")
+LOCK = text("SELECT pg_advisory_lock(:key)").bindparams(_KEY)
+LOCK_SHARED = text("SELECT pg_advisory_lock_shared(:key)").bindparams(_KEY)
+LOCK_XACT = text("SELECT pg_advisory_xact_lock(:key)").bindparams(_KEY)
+LOCK_XACT_SHARED = text("SELECT pg_advisory_xact_lock_shared(:key)").bindparams(_KEY)
 
-UNLOCK = text("SELECT pg_advisory_unlock(:key)")
-UNLOCK_SHARED = text("SELECT pg_advisory_unlock_shared(:key)")
+TRY_LOCK = text("SELECT pg_try_advisory_lock(:key)").bindparams(_KEY)
+TRY_LOCK_SHARED = text("SELECT pg_try_advisory_lock_shared(:key)").bindparams(_KEY)
+TRY_LOCK_XACT = text("SELECT pg_try_advisory_xact_lock(:key)").bindparams(_KEY)
+TRY_LOCK_XACT_SHARED = text("SELECT pg_try_advisory_xact_lock_shared(:key)").bindparams(_KEY)
+
+UNLOCK = text("SELECT pg_advisory_unlock(:key)").bindparams(_KEY)
+UNLOCK_SHARED = text("SELECT pg_advisory_unlock_shared(:key)").bindparams(_KEY)
+
+# ``(shared, xact)`` => ``(lock, try_lock, unlock)``
+# Transaction level advisory locks can not be released manually, so they have no unlock statement.
+STATEMENTS = {
+    (False, False): (LOCK, TRY_LOCK, UNLOCK),
+    (True, False): (LOCK_SHARED, TRY_LOCK_SHARED, UNLOCK_SHARED),
+    (False, True): (LOCK_XACT, TRY_LOCK_XACT, None),
+    (True, True): (LOCK_XACT_SHARED, TRY_LOCK_XACT_SHARED, None),
+}
+
+
+def _make_many(func: str) -> TextClause:
+    """``SELECT func(k) FROM unnest(:keys) ...``, one row per key, in the same order as ``keys``"""
+    return text(f"SELECT {func}(k) FROM unnest(:keys) WITH ORDINALITY AS t(k, i) ORDER BY i").bindparams(
+        bindparam("keys", type_=ARRAY(BigInteger))
+    )
+
+
+# ``(shared, xact)`` => ``(lock_many, try_lock_many, unlock_many)``, like :data:`STATEMENTS`
+MANY_STATEMENTS = {
+    (False, False): (
+        _make_many("pg_advisory_lock"),
+        _make_many("pg_try_advisory_lock"),
+        _make_many("pg_advisory_unlock"),
+    ),
+    (True, False): (
+        _make_many("pg_advisory_lock_shared"),
+        _make_many("pg_try_advisory_lock_shared"),
+        _make_many("pg_advisory_unlock_shared"),
+    ),
+    (False, True): (_make_many("pg_advisory_xact_lock"), _make_many("pg_try_advisory_xact_lock"), None),
+    (True, True): (_make_many("pg_advisory_xact_lock_shared"), _make_many("pg_try_advisory_xact_lock_shared"), None),
+}
 
 
 SLEEP_INTERVAL_DEFAULT = 1
 SLEEP_INTERVAL_MIN = 0.1
+SLEEP_INTERVAL_BACKOFF = 1.5
@@ -1,8 +1,21 @@
+import sys
 from typing import Union
 
+if sys.version_info >= (3, 11):  # pragma: no cover
+    from typing import Self
+else:  # pragma: no cover
+    from typing_extensions import Self
+
+if sys.version_info >= (3, 12):  # pragma: no cover
+    from typing import override
+else:  # pragma: no cover
+    from typing_extensions import override
+
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_scoped_session
 from sqlalchemy.orm import Session, scoped_session
 
+__all__ = ["ConnectionOrSessionT", "AsyncConnectionOrSessionT", "Self", "override"]
+
 ConnectionOrSessionT = Union[Connection, Session, scoped_session]
 AsyncConnectionOrSessionT = Union[AsyncConnection, AsyncSession, async_scoped_session]
@@ -60,6 +60,18 @@ class KeyConvertTestCase(IsolatedAsyncioTestCase):
                 with self.assertRaises(ValueError):
                     create_async_sadlock(conn, key)
 
+    async def test_mysql_key_gt_max_length_hash_oversize(self):
+        for engine in get_engines():
+            if engine.name != "mysql":
+                continue
+            key = "".join(choice([chr(n) for n in range(0x20, 0x7F)]) for _ in range(MYSQL_LOCK_NAME_MAX_LENGTH + 1))
+            async with engine.connect() as conn:
+                async with create_async_sadlock(conn, key, hash_oversize=True) as lock:
+                    self.assertTrue(lock.locked)
+                    self.assertEqual(len(lock.key), MYSQL_LOCK_NAME_MAX_LENGTH)
+                    self.assertEqual(lock.key, create_async_sadlock(conn, key, hash_oversize=True).key)
+                self.assertFalse(lock.locked)
+
     async def test_mysql_key_not_a_string(self):
         keys = None, 1, 0, -1, 0.1, True, False, (), [], set(), {}, object()
         for engine in get_engines():
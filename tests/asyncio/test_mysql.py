@@ -0,0 +1,38 @@
+from contextlib import AsyncExitStack
+from unittest import IsolatedAsyncioTestCase
+from uuid import uuid4
+
+from sqlalchemy_dlock.lock.mysql import MysqlAsyncSadLock
+
+from .engines import create_engines, dispose_engines, get_engines
+
+
+class MysqlTestCase(IsolatedAsyncioTestCase):
+    def setUp(self):
+        create_engines()
+
+    async def asyncTearDown(self):
+        await dispose_engines()
+
+    async def test_acquire_many(self):
+        for engine in get_engines():
+            if engine.name != "mysql":
+                continue
+            keys = [uuid4().hex for _ in range(8)]
+            async with AsyncExitStack() as stack:
+                conn0, conn1 = [await stack.enter_async_context(engine.connect()) for _ in range(2)]
+                locks0 = await MysqlAsyncSadLock.acquire_many(conn0, keys[:4])
+                self.assertEqual([lck.key for lck in locks0], keys[:4])
+                self.assertTrue(all(lck.locked for lck in locks0))
+                locks1 = await MysqlAsyncSadLock.acquire_many(conn1, keys[2:6], block=False)
+                self.assertEqual([lck.locked for lck in locks1], [False, False, True, True])
+                for lck in locks0 + locks1:
+                    await lck.close()
+                    self.assertFalse(lck.locked)
+
+    async def test_acquire_many_empty(self):
+        for engine in get_engines():
+            if engine.name != "mysql":
+                continue
+            async with engine.connect() as conn:
+                self.assertEqual(await MysqlAsyncSadLock.acquire_many(conn, []), [])
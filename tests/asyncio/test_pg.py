@@ -1,9 +1,11 @@
 import asyncio
 import sys
+from contextlib import AsyncExitStack
 from unittest import IsolatedAsyncioTestCase, skipIf
 from uuid import uuid4
 
 from sqlalchemy_dlock import create_async_sadlock
+from sqlalchemy_dlock.lock.postgresql import PostgresqlAsyncSadLock
 
 from .engines import create_engines, dispose_engines, get_engines
 
@@ -63,3 +65,43 @@ class PgTestCase(IsolatedAsyncioTestCase):
                     await asyncio.sleep(3)
 
             await asyncio.wait_for(task, 10)
+
+    async def test_acquire_many(self):
+        for engine in get_engines():
+            if engine.name != "postgresql":
+                continue
+            keys = [uuid4().hex for _ in range(8)]
+            async with AsyncExitStack() as stack:
+                conn0, conn1 = [await stack.enter_async_context(engine.connect()) for _ in range(2)]
+                locks0 = await PostgresqlAsyncSadLock.acquire_many(conn0, keys[:4])
+                self.assertEqual([lck.key for lck in locks0], [lck.actual_key for lck in locks0])
+                self.assertTrue(all(lck.locked for lck in locks0))
+                locks1 = await PostgresqlAsyncSadLock.acquire_many(conn1, keys[2:6], block=False)
+                self.assertEqual([lck.locked for lck in locks1], [False, False, True, True])
+                for lck in locks0 + locks1:
+                    await lck.close()
+                    self.assertFalse(lck.locked)
+
+    async def test_acquire_many_empty(self):
+        for engine in get_engines():
+            if engine.name != "postgresql":
+                continue
+            async with engine.connect() as conn:
+                self.assertEqual(await PostgresqlAsyncSadLock.acquire_many(conn, []), [])
+
+    async def test_release_many(self):
+        for engine in get_engines():
+            if engine.name != "postgresql":
+                continue
+            keys = [uuid4().hex for _ in range(4)]
+            async with AsyncExitStack() as stack:
+                conn0, conn1 = [await stack.enter_async_context(engine.connect()) for _ in range(2)]
+                locks0 = await PostgresqlAsyncSadLock.acquire_many(conn0, keys)
+                await PostgresqlAsyncSadLock.release_many(locks0)
+                self.assertFalse(any(lck.locked for lck in locks0))
+                locks1 = await PostgresqlAsyncSadLock.acquire_many(conn1, keys, block=False)
+                self.assertTrue(all(lck.locked for lck in locks1))
+                with self.assertRaises(ValueError):
+                    await PostgresqlAsyncSadLock.release_many(locks0)
+                await PostgresqlAsyncSadLock.release_many(locks1)
+                self.assertFalse(any(lck.locked for lck in locks1))
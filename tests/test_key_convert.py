@@ -5,7 +5,7 @@ from uuid import uuid4
 from zlib import crc32
 
 from sqlalchemy_dlock import create_sadlock
-from sqlalchemy_dlock.lock.mysql import MYSQL_LOCK_NAME_MAX_LENGTH
+from sqlalchemy_dlock.lock.mysql import MYSQL_LOCK_NAME_MAX_LENGTH, MysqlSadLock
 
 from .engines import ENGINES
 
@@ -58,6 +58,18 @@ class KeyConvertTestCase(TestCase):
                 with self.assertRaises(ValueError):
                     create_sadlock(conn, key)
 
+    def test_mysql_key_gt_max_length_hash_oversize(self):
+        for engine in ENGINES:
+            if engine.name != "mysql":
+                continue
+            key = "".join(choice([chr(n) for n in range(0x20, 0x7F)]) for _ in range(MYSQL_LOCK_NAME_MAX_LENGTH + 1))
+            with engine.connect() as conn:
+                with create_sadlock(conn, key, hash_oversize=True) as lock:
+                    self.assertTrue(lock.locked)
+                    self.assertEqual(len(lock.key), MYSQL_LOCK_NAME_MAX_LENGTH)
+                    self.assertEqual(lock.key, create_sadlock(conn, key, hash_oversize=True).key)
+                self.assertFalse(lock.locked)
+
     def test_mysql_key_not_a_string(self):
         keys = None, 1, 0, -1, 0.1, True, False, (), [], set(), {}, object()
 
@@ -70,6 +82,20 @@ class KeyConvertTestCase(TestCase):
                     with self.assertRaises(TypeError):
                         create_sadlock(conn, k, convert=lambda x: x)
 
+    def test_mysql_overridden_convert_not_a_string(self):
+        class _Lock(MysqlSadLock):
+            @classmethod
+            def convert(cls, k):
+                return k
+
+        for engine in ENGINES:
+            if engine.name != "mysql":
+                continue
+
+            with engine.connect() as conn:
+                with self.assertRaises(TypeError):
+                    _Lock(conn, 1)
+
     def test_postgresql_key_max(self):
         for engine in ENGINES:
             if engine.name != "postgresql":
@@ -0,0 +1,36 @@
+from contextlib import ExitStack
+from unittest import TestCase
+from uuid import uuid4
+
+from sqlalchemy_dlock.lock.mysql import MysqlSadLock
+
+from .engines import ENGINES
+
+
+class MysqlTestCase(TestCase):
+    def tearDown(self):
+        for engine in ENGINES:
+            engine.dispose()
+
+    def test_acquire_many(self):
+        for engine in ENGINES:
+            if engine.name != "mysql":
+                continue
+            keys = [uuid4().hex for _ in range(8)]
+            with ExitStack() as stack:
+                conn0, conn1 = [stack.enter_context(engine.connect()) for _ in range(2)]
+                locks0 = MysqlSadLock.acquire_many(conn0, keys[:4])
+                self.assertEqual([lck.key for lck in locks0], keys[:4])
+                self.assertTrue(all(lck.locked for lck in locks0))
+                locks1 = MysqlSadLock.acquire_many(conn1, keys[2:6], block=False)
+                self.assertEqual([lck.locked for lck in locks1], [False, False, True, True])
+                for lck in locks0 + locks1:
+                    lck.close()
+                    self.assertFalse(lck.locked)
+
+    def test_acquire_many_empty(self):
+        for engine in ENGINES:
+            if engine.name != "mysql":
+                continue
+            with engine.connect() as conn:
+                self.assertEqual(MysqlSadLock.acquire_many(conn, []), [])
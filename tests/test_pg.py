@@ -1,9 +1,11 @@
+from contextlib import ExitStack
 from threading import Barrier, Thread
 from time import sleep
 from unittest import TestCase
 from uuid import uuid4
 
 from sqlalchemy_dlock import create_sadlock
+from sqlalchemy_dlock.lock.postgresql import PostgresqlSadLock
 
 from .engines import ENGINES
 
@@ -70,3 +72,32 @@ class PgTestCase(TestCase):
 
             if trd_exc is not None:
                 raise trd_exc  # type: ignore
+
+    def test_acquire_many(self):
+        for engine in ENGINES:
+            if engine.name != "postgresql":
+                continue
+            keys = [uuid4().hex for _ in range(8)]
+            with ExitStack() as stack:
+                conn0, conn1 = [stack.enter_context(engine.connect()) for _ in range(2)]
+                locks0 = PostgresqlSadLock.acquire_many(conn0, keys[:4])
+                self.assertTrue(all(lck.locked for lck in locks0))
+                locks1 = PostgresqlSadLock.acquire_many(conn1, keys[2:6], block=False)
+                self.assertEqual([lck.locked for lck in locks1], [False, False, True, True])
+                PostgresqlSadLock.release_many(locks0)
+                self.assertFalse(any(lck.locked for lck in locks0))
+                for lck in locks1:
+                    lck.close()
+                    self.assertFalse(lck.locked)
+
+    def test_release_many_xact(self):
+        for engine in ENGINES:
+            if engine.name != "postgresql":
+                continue
+            keys = [uuid4().hex for _ in range(4)]
+            with engine.connect() as conn:
+                with conn.begin():
+                    locks = PostgresqlSadLock.acquire_many(conn, keys, xact=True)
+                    with self.assertWarns(RuntimeWarning):
+                        PostgresqlSadLock.release_many(locks)
+                    self.assertTrue(all(lck.locked for lck in locks))
@@ -0,0 +1,92 @@
+from time import monotonic
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import patch
+
+from sqlalchemy_dlock.lock.postgresql import PostgresqlAsyncSadLock, PostgresqlSadLock
+
+
+class _Result:
+    def scalar(self):
+        return False
+
+
+class _Clock:
+    """A fake monotonic clock, only advanced by sleeps and by each statement's round-trip"""
+
+    ROUND_TRIP = 0.001
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class _Connection:
+    """A connection stub on which the try-lock always fails"""
+
+    def __init__(self, clock):
+        self.clock = clock
+
+    def execute(self, *args, **kwargs):
+        self.clock.now += self.clock.ROUND_TRIP
+        return _Result()
+
+
+class _AsyncConnection(_Connection):
+    async def execute(self, *args, **kwargs):
+        return _Connection.execute(self, *args, **kwargs)
+
+
+# 0.1, then grows by 1.5 times after every failed try, capped at `interval`
+EXPECTED_SLEEPS = [0.1, 0.15, 0.225, 0.3375, 0.5, 0.5, 0.5]
+
+
+class PgPollTestCase(TestCase):
+    def test_backoff(self):
+        clock = _Clock()
+        lck = PostgresqlSadLock(_Connection(clock), "key")
+        patch_clock = patch("sqlalchemy_dlock.lock.postgresql.monotonic", clock.monotonic)
+        patch_sleep = patch("sqlalchemy_dlock.lock.postgresql.sleep", clock.sleep)
+        with patch_clock, patch_sleep:
+            self.assertFalse(lck.acquire(timeout=3, interval=0.5))
+        self.assertGreater(len(clock.sleeps), len(EXPECTED_SLEEPS))
+        for actual, expected in zip(clock.sleeps, EXPECTED_SLEEPS):
+            self.assertAlmostEqual(actual, expected)
+        self.assertTrue(all(x <= 0.5 for x in clock.sleeps))
+
+    def test_timeout_with_big_interval(self):
+        # the real clock: sleeps are clamped to the deadline, not rounded up to `interval`
+        lck = PostgresqlSadLock(_Connection(_Clock()), "key")
+        ts_begin = monotonic()
+        self.assertFalse(lck.acquire(timeout=0.5, interval=10))
+        self.assertLess(monotonic() - ts_begin, 0.75)
+
+
+class PgAsyncPollTestCase(IsolatedAsyncioTestCase):
+    async def test_backoff(self):
+        clock = _Clock()
+
+        async def async_sleep(seconds):
+            clock.sleep(seconds)
+
+        lck = PostgresqlAsyncSadLock(_AsyncConnection(clock), "key")
+        patch_clock = patch("sqlalchemy_dlock.lock.postgresql.monotonic", clock.monotonic)
+        patch_sleep = patch("sqlalchemy_dlock.lock.postgresql.asyncio.sleep", async_sleep)
+        with patch_clock, patch_sleep:
+            self.assertFalse(await lck.acquire(timeout=3, interval=0.5))
+        self.assertGreater(len(clock.sleeps), len(EXPECTED_SLEEPS))
+        for actual, expected in zip(clock.sleeps, EXPECTED_SLEEPS):
+            self.assertAlmostEqual(actual, expected)
+        self.assertTrue(all(x <= 0.5 for x in clock.sleeps))
+
+    async def test_timeout_with_big_interval(self):
+        lck = PostgresqlAsyncSadLock(_AsyncConnection(_Clock()), "key")
+        ts_begin = monotonic()
+        self.assertFalse(await lck.acquire(timeout=0.5, interval=10))
+        self.assertLess(monotonic() - ts_begin, 0.75)
@@ -0,0 +1,14 @@
+from unittest import TestCase
+
+from sqlalchemy_dlock.registry import ASYNCIO_REGISTRY, REGISTRY, find_lock_class, preload_lock_classes
+
+
+class RegistryTestCase(TestCase):
+    def test_preload_lock_classes(self):
+        preload_lock_classes()
+        hits = find_lock_class.cache_info().hits
+        for engine_name in REGISTRY:
+            self.assertEqual(find_lock_class(engine_name).__name__, REGISTRY[engine_name]["class"])
+        for engine_name in ASYNCIO_REGISTRY:
+            self.assertEqual(find_lock_class(engine_name, True).__name__, ASYNCIO_REGISTRY[engine_name]["class"])
+        self.assertEqual(find_lock_class.cache_info().hits, hits + len(REGISTRY) + len(ASYNCIO_REGISTRY))